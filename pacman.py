@@ -1,8 +1,11 @@
 import sys
 import math
 import random
+import time
+import numpy as np
 import pygame
 from pygame.locals import K_UP, K_DOWN, K_LEFT, K_RIGHT, K_a, K_d, K_w, K_s, K_ESCAPE, QUIT, KEYDOWN
+from pygame.locals import VIDEOEXPOSE, WINDOWEXPOSED
 
 # =============================
 # Config & Constants
@@ -29,6 +32,9 @@ STATE_POWER = "power"
 STATE_GAMEOVER = "gameover"
 
 POWER_DURATION = 8.0  # seconds
+# Longest move in one frame, in cells. Moves shorter than a cell can only
+# enter the destination cell, so update_move probes just that one.
+MAX_STEP = 0.4
 
 # =============================
 # Static Maze Definition
@@ -76,6 +82,16 @@ COLS = len(MAZE_LAYOUT[0])
 WIDTH = COLS * TILE_SIZE
 HEIGHT = ROWS * TILE_SIZE + 60  # space for HUD
 
+# Layout as flat ASCII bytes, indexed as MAZE_BYTES[row * COLS + col];
+# indexing bytes yields an int, so is_wall is a plain int compare
+MAZE_BYTES = bytes(''.join(MAZE_LAYOUT), 'ascii')
+WALL_BYTE = ord('#')
+# The same layout as a (ROWS, COLS) array, indexed as GRID[row, col]
+GRID = np.frombuffer(MAZE_BYTES, dtype=np.uint8).reshape(ROWS, COLS)
+# Static wall bitmap (1 = wall) for the adjacency table and wall surface;
+# per-cell wall tests go through is_wall
+WALLS = (GRID == WALL_BYTE).astype(np.uint8)
+
 # Utility
 
 def grid_to_px(col, row):
@@ -87,56 +103,110 @@ def px_center_of_cell(col, row):
     return x + TILE_SIZE // 2, y + TILE_SIZE // 2
 
 
+def cell_rect(col, row):
+    # Screen area an entity at (col, row) draws into
+    x, y = grid_to_px(int(col), int(row))
+    return pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+
+
 def is_wall(col, row):
-    if 0 <= row < ROWS and 0 <= col < COLS:
-        return MAZE_LAYOUT[row][col] == '#'
-    return True
+    # The one per-cell wall test; off-grid cells count as walls
+    return not (0 <= row < ROWS and 0 <= col < COLS) or MAZE_BYTES[row * COLS + col] == WALL_BYTE
 
 
 def valid_cell(col, row):
-    return 0 <= row < ROWS and 0 <= col < COLS and not is_wall(col, row)
+    return not is_wall(col, row)
+
+
+# Directions as (dx, dy) grid steps
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+UP = (0, -1)
+DOWN = (0, 1)
+# Directions as indices 0..3 into DIR_VEC; DIR_NONE means standing still
+DIR_VEC = [LEFT, RIGHT, UP, DOWN, (0, 0)]
+DIR_NONE = 4
+DIR_INDEX = {d: i for i, d in enumerate(DIR_VEC)}
+OPPOSITE = [1, 0, 3, 2, DIR_NONE]
+
+KEY_DIRS = {
+    K_LEFT: LEFT, K_a: LEFT,
+    K_RIGHT: RIGHT, K_d: RIGHT,
+    K_UP: UP, K_w: UP,
+    K_DOWN: DOWN, K_s: DOWN,
+}
+
+# Walkable directions out of each cell as a bitmask (bit i = DIR_VEC[i]),
+# indexed as ADJ_MASK_NP[row, col]; off-grid neighbours count as walls
+_OPEN = np.pad(WALLS == 0, 1, constant_values=False)
+ADJ_MASK_NP = sum(_OPEN[1 + dy:1 + dy + ROWS, 1 + dx:1 + dx + COLS].astype(np.int64) << i
+                  for i, (dx, dy) in enumerate(DIR_VEC[:4]))
+# Cells where a ghost may have to turn: junctions, corners and dead ends.
+# Anywhere else is a straight corridor (left+right or up+down only) and
+# the only move is to keep going.
+INTERSECTIONS_NP = (ADJ_MASK_NP != 0b0011) & (ADJ_MASK_NP != 0b1100)
+# Per-direction bit positions and steps, for scoring all moves at once
+DIR_BITS = np.arange(4)
+DIR_DX = np.array([dx for dx, _ in DIR_VEC[:4]])
+DIR_DY = np.array([dy for _, dy in DIR_VEC[:4]])
 
 
 class Maze:
     def __init__(self):
-        self.pellets = set()
-        self.power_pellets = set()
-        self.player_start = None
-        self.ghost_starts = []
-        for r, line in enumerate(MAZE_LAYOUT):
-            for c, ch in enumerate(line):
-                if ch == '.':
-                    self.pellets.add((c, r))
-                elif ch == 'o':
-                    self.power_pellets.add((c, r))
-                elif ch == 'P' and self.player_start is None:
-                    self.player_start = (c, r)
-                elif ch == 'G':
-                    self.ghost_starts.append((c, r))
+        self.grid = GRID
+        self.wall_mask = WALLS
+        # Pellet bitmaps (1 = pellet present), indexed as [row, col]
+        self.pellets = (GRID == ord('.')).astype(np.uint8)
+        self.power_pellets = (GRID == ord('o')).astype(np.uint8)
+        # argwhere yields (row, col) in row-major order; flip to (col, row)
+        players = np.argwhere(GRID == ord('P'))[:, ::-1].tolist()
+        self.player_start = tuple(players[0]) if players else None
+        self.ghost_starts = [tuple(p) for p in np.argwhere(GRID == ord('G'))[:, ::-1].tolist()]
         # Fallbacks
         if self.player_start is None:
             # center
             self.player_start = (COLS // 2, ROWS // 2)
         if not self.ghost_starts:
             self.ghost_starts = [(COLS // 2 - 1, ROWS // 2), (COLS // 2 + 1, ROWS // 2)]
+        # Walls are static, so rasterize them once and blit every frame
+        self.wall_surface = pygame.Surface((WIDTH, ROWS * TILE_SIZE))
+        for r, c in np.argwhere(self.wall_mask):
+            x, y = grid_to_px(c, r)
+            pygame.draw.rect(self.wall_surface, NAVY, (x, y, TILE_SIZE, TILE_SIZE))
+            # inner outline for classic look
+            pygame.draw.rect(self.wall_surface, BLUE, (x+4, y+4, TILE_SIZE-8, TILE_SIZE-8), 2)
+        self.wall_surface = self.wall_surface.convert()
+        # Pellets are cached too; set dirty whenever one is eaten
+        self.pellet_surface = pygame.Surface((WIDTH, ROWS * TILE_SIZE), pygame.SRCALPHA).convert_alpha()
+        self.dirty = True
+        # Cells whose pellet was eaten since the last draw
+        self.cleared = []
+
+    def _rebuild_pellets(self):
+        self.pellet_surface.fill((0, 0, 0, 0))
+        for r, c in np.argwhere(self.pellets):
+            x, y = px_center_of_cell(c, r)
+            pygame.draw.circle(self.pellet_surface, WHITE, (x, y), 3)
+        for r, c in np.argwhere(self.power_pellets):
+            x, y = px_center_of_cell(c, r)
+            pygame.draw.circle(self.pellet_surface, WHITE, (x, y), 6)
+        self.dirty = False
 
     def draw(self, surf):
         # Draw walls
-        for r, line in enumerate(MAZE_LAYOUT):
-            for c, ch in enumerate(line):
-                if ch == '#':
-                    x, y = grid_to_px(c, r)
-                    pygame.draw.rect(surf, NAVY, (x, y, TILE_SIZE, TILE_SIZE))
-                    # inner outline for classic look
-                    pygame.draw.rect(surf, BLUE, (x+4, y+4, TILE_SIZE-8, TILE_SIZE-8), 2)
-        # Draw pellets
-        for (c, r) in self.pellets:
-            x, y = px_center_of_cell(c, r)
-            pygame.draw.circle(surf, WHITE, (x, y), 3)
-        # Draw power pellets
-        for (c, r) in self.power_pellets:
-            x, y = px_center_of_cell(c, r)
-            pygame.draw.circle(surf, WHITE, (x, y), 6)
+        surf.blit(self.wall_surface, (0, 0))
+        # Draw pellets and power pellets
+        if self.dirty:
+            self._rebuild_pellets()
+        surf.blit(self.pellet_surface, (0, 0))
+        self.cleared.clear()
+
+    def draw_area(self, surf, rect):
+        # Restore the maze background inside rect
+        if self.dirty:
+            self._rebuild_pellets()
+        surf.blit(self.wall_surface, rect, rect)
+        surf.blit(self.pellet_surface, rect, rect)
 
 
 class Entity:
@@ -145,15 +215,31 @@ class Entity:
         self.row = float(row)
         self.dir = (0, 0)  # dx, dy in grid steps
         self.speed = speed  # cells per second
+        self.stalled = False  # True if the last update_move left it in place
+        self._update_cell()
 
     @property
     def pos(self):
         return (self.col, self.row)
 
+    @property
+    def cell(self):
+        # Nearest grid cell, cached; refreshed whenever the entity moves
+        return self._cell
+
+    def _update_cell(self):
+        self._cell = (int(round(self.col)), int(round(self.row)))
+
+    def place(self, col, row):
+        self.col = float(col)
+        self.row = float(row)
+        self.dir = (0, 0)
+        self.stalled = False
+        self._update_cell()
+
     def cell_centered(self):
         # Check if near the center of a cell to allow turning
-        cx = round(self.col)
-        cy = round(self.row)
+        cx, cy = self._cell
         return abs(self.col - cx) < 0.1 and abs(self.row - cy) < 0.1
 
     def set_dir_if_valid(self, d):
@@ -167,31 +253,25 @@ class Entity:
             self.row = round(self.row)
 
     def update_move(self, dt):
+        dx, dy = self.dir
+        # Movement is axis-aligned and capped at MAX_STEP per frame, so
+        # only the destination cell needs probing even after a long frame
+        assert dx == 0 or dy == 0, "diagonal direction"
+        dt = min(dt, MAX_STEP / self.speed)
+        col, row = self.col, self.row
+        next_col = col + dx * self.speed * dt
+        next_row = row + dy * self.speed * dt
         # Wrap tunnels horizontally
-        next_col = self.col + self.dir[0] * self.speed * dt
-        next_row = self.row + self.dir[1] * self.speed * dt
-        # Check collision against walls with small steps for robustness
-        steps = max(1, int(max(abs(next_col - self.col), abs(next_row - self.row)) * 4))
-        for i in range(steps):
-            t = (i + 1) / steps
-            pcol = self.col + (next_col - self.col) * t
-            prow = self.row + (next_row - self.row) * t
-            # tunnel wrap
-            if pcol < 0:
-                pcol = COLS - 1
-            elif pcol >= COLS:
-                pcol = 0
-            ic = int(round(pcol))
-            ir = int(round(prow))
-            if is_wall(ic, ir):
-                # stop before wall
-                return
-        self.col = next_col
-        self.row = next_row
-        if self.col < 0:
-            self.col = COLS - 1
-        elif self.col >= COLS:
-            self.col = 0
+        if next_col < 0:
+            next_col = COLS - 1.0
+        elif next_col >= COLS:
+            next_col = 0.0
+        # stop before wall
+        if not is_wall(int(round(next_col)), int(round(next_row))):
+            self.col, self.row = next_col, next_row
+        self.stalled = self.col == col and self.row == row
+        if not self.stalled:
+            self._update_cell()
 
 
 class Player(Entity):
@@ -200,40 +280,34 @@ class Player(Entity):
         self.next_dir = (0, 0)
         self.lives = 3
         self.score = 0
-
-    def handle_input(self, pressed):
-        nd = self.next_dir
-        if pressed[K_LEFT] or pressed[K_a]:
-            nd = (-1, 0)
-        elif pressed[K_RIGHT] or pressed[K_d]:
-            nd = (1, 0)
-        elif pressed[K_UP] or pressed[K_w]:
-            nd = (0, -1)
-        elif pressed[K_DOWN] or pressed[K_s]:
-            nd = (0, 1)
-        self.next_dir = nd
+        # Pre-rendered sprite, blitted every frame
+        self._surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(self._surf, YELLOW, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 2 - 2)
+        self._surf = self._surf.convert_alpha()
 
     def update(self, maze: Maze, dt):
         # Try to apply next_dir when centered
         if self.cell_centered() and self.next_dir != self.dir:
             self.set_dir_if_valid(self.next_dir)
         # Move
-        prev_col, prev_row = int(round(self.col)), int(round(self.row))
         super().update_move(dt)
-        c, r = int(round(self.col)), int(round(self.row))
+        c, r = self._cell
         # Eat pellets
-        if (c, r) in maze.pellets:
-            maze.pellets.remove((c, r))
+        if maze.pellets[r, c]:
+            maze.pellets[r, c] = 0
+            maze.dirty = True
+            maze.cleared.append((c, r))
             self.score += 10
-        if (c, r) in maze.power_pellets:
-            maze.power_pellets.remove((c, r))
+        if maze.power_pellets[r, c]:
+            maze.power_pellets[r, c] = 0
+            maze.dirty = True
+            maze.cleared.append((c, r))
             self.score += 50
             return 'power'
         return None
 
     def draw(self, surf):
-        x, y = px_center_of_cell(int(self.col), int(self.row))
-        pygame.draw.circle(surf, YELLOW, (x, y), TILE_SIZE // 2 - 2)
+        surf.blit(self._surf, grid_to_px(int(self.col), int(self.row)))
 
 
 class Ghost(Entity):
@@ -244,27 +318,24 @@ class Ghost(Entity):
         self.frightened = False
         self.eaten = False
         self.home = (col, row)
+        # Pre-rendered sprites, blitted every frame
+        self._surf_normal = self._render_sprite(color)
+        self._surf_frightened = self._render_sprite(BLUE)
+
+    @staticmethod
+    def _render_sprite(color):
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        x, y = TILE_SIZE // 2, TILE_SIZE // 2
+        body_rect = pygame.Rect(0, 0, TILE_SIZE - 4, TILE_SIZE - 4)
+        body_rect.center = (x, y)
+        pygame.draw.rect(sprite, color, body_rect, border_radius=8)
+        # eyes
+        pygame.draw.circle(sprite, WHITE, (x - 4, y - 2), 3)
+        pygame.draw.circle(sprite, WHITE, (x + 4, y - 2), 3)
+        return sprite.convert_alpha()
 
-    def available_dirs(self):
-        options = []
-        for d in [(-1,0),(1,0),(0,-1),(0,1)]:
-            ncol = int(round(self.col + d[0]))
-            nrow = int(round(self.row + d[1]))
-            if valid_cell(ncol, nrow):
-                options.append(d)
-        return options
-
-    def choose_dir(self):
-        options = self.available_dirs()
-        # Avoid 180 turn if possible
-        opposite = (-self.dir[0], -self.dir[1])
-        if len(options) > 1 and opposite in options:
-            options.remove(opposite)
-        if not options:
-            return opposite
-        return random.choice(options)
-
-    def update(self, dt, player_pos):
+    def update(self, dt):
+        # Direction is chosen for all ghosts at once by Game.steer_ghosts
         # Adjust speed based on frightened/eaten
         if self.eaten:
             self.speed = self.base_speed * 1.2
@@ -272,49 +343,12 @@ class Ghost(Entity):
             self.speed = self.base_speed * 0.6
         else:
             self.speed = self.base_speed
-
-        # Decide new dir at intersections (near center)
-        if self.cell_centered():
-            # Simple AI: if frightened, move away from player; if normal, random with bias towards player
-            options = self.available_dirs()
-            opposite = (-self.dir[0], -self.dir[1])
-            if len(options) > 1 and opposite in options:
-                options.remove(opposite)
-
-            def dist_sq_after_dir(d):
-                nx = round(self.col) + d[0]
-                ny = round(self.row) + d[1]
-                px, py = player_pos
-                return (nx - px) ** 2 + (ny - py) ** 2
-
-            if options:
-                if self.eaten:
-                    # Head home: choose direction minimizing distance to home
-                    hx, hy = self.home
-                    options.sort(key=lambda d: (round(self.col)+d[0]-hx)**2 + (round(self.row)+d[1]-hy)**2)
-                    self.dir = options[0]
-                elif self.frightened:
-                    # Maximize distance from player
-                    options.sort(key=lambda d: -dist_sq_after_dir(d))
-                    self.dir = options[0]
-                else:
-                    # Minimize distance to player, with some randomness
-                    random.shuffle(options)
-                    options.sort(key=lambda d: dist_sq_after_dir(d))
-                    self.dir = options[0]
         # Move
         super().update_move(dt)
 
     def draw(self, surf):
-        x, y = px_center_of_cell(int(self.col), int(self.row))
-        color = BLUE if self.frightened and not self.eaten else self.color
-        body_rect = pygame.Rect(0, 0, TILE_SIZE - 4, TILE_SIZE - 4)
-        body_rect.center = (x, y)
-        pygame.draw.rect(surf, color, body_rect, border_radius=8)
-        # eyes
-        eye_color = WHITE if not self.frightened or self.eaten else WHITE
-        pygame.draw.circle(surf, eye_color, (x - 4, y - 2), 3)
-        pygame.draw.circle(surf, eye_color, (x + 4, y - 2), 3)
+        sprite = self._surf_frightened if self.frightened and not self.eaten else self._surf_normal
+        surf.blit(sprite, grid_to_px(int(self.col), int(self.row)))
 
 
 class Game:
@@ -325,88 +359,129 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Arial", 20)
         self.big_font = pygame.font.SysFont("Arial", 40, bold=True)
+        self._hud_cache = {}  # slot -> (text, rendered Surface)
         self.reset_level(full_reset=True)
 
     def reset_level(self, full_reset=False):
         self.maze = Maze()
         ps = self.maze.player_start
         self.player = Player(ps[0], ps[1])
-        self.ghosts = []
         colors = [RED, PINK, CYAN, ORANGE]
         starts = self.maze.ghost_starts
-        for i in range(min(4, len(starts))):
+        n = min(4, len(starts))
+        self.ghosts = []
+        for i in range(n):
             c = starts[i]
             self.ghosts.append(Ghost(c[0], c[1], colors[i % len(colors)]))
         if not full_reset:
             # keep score and lives
             pass
         self.state = STATE_PLAYING
-        self.power_timer = 0.0
+        self._power_deadline = 0.0
+        # New maze: force a full redraw on the next frame
+        self._prev_rects = None
+        self._input_dirty = True
 
     def set_power_mode(self):
         self.state = STATE_POWER
-        self.power_timer = POWER_DURATION
+        self._power_deadline = time.monotonic() + POWER_DURATION
         for g in self.ghosts:
             if not g.eaten:
                 g.frightened = True
 
-    def update_power_timer(self, dt):
-        if self.state == STATE_POWER:
-            self.power_timer -= dt
-            if self.power_timer <= 0:
-                self.state = STATE_PLAYING
-                for g in self.ghosts:
-                    g.frightened = False
-                    g.eaten = False if g.eaten else g.eaten
+    def power_time_left(self):
+        return max(0.0, self._power_deadline - time.monotonic())
 
     def lose_life_and_reset_positions(self):
         self.player.lives -= 1
         ps = self.maze.player_start
-        self.player.col, self.player.row = float(ps[0]), float(ps[1])
-        self.player.dir = (0, 0)
-        for i, g in enumerate(self.ghosts):
-            gs = self.maze.ghost_starts[i % len(self.maze.ghost_starts)]
-            g.col, g.row = float(gs[0]), float(gs[1])
-            g.dir = (0, 0)
+        self.player.place(ps[0], ps[1])
+        # Every ghost's home is its start cell
+        for g in self.ghosts:
+            g.place(*g.home)
             g.frightened = False
             g.eaten = False
         self.state = STATE_PLAYING
-        self.power_timer = 0.0
-
-    def handle_collisions(self):
-        pc, pr = int(round(self.player.col)), int(round(self.player.row))
+        self._power_deadline = 0.0
+
+    def steer_ghosts(self, player_cell):
+        """Pick a new direction for every ghost at a decision point.
+
+        Simple AI, evaluated for all deciding ghosts at once: each walkable
+        move is scored by squared distance to the ghost's target after
+        taking it. Eaten ghosts head home, frightened ones flee the player
+        and the rest chase the player.
+        """
+        # Decide at intersections (near center); in straight corridors
+        # ghosts just keep going. Most frames no ghost qualifies, so this
+        # cheap per-ghost gate runs before any array work.
+        ghosts = [g for g in self.ghosts
+                  if g.cell_centered() and (g.dir == (0, 0) or INTERSECTIONS_NP[g.cell[1], g.cell[0]])]
+        if not ghosts:
+            return
+        rows = []
+        jitter = []
+        for g in ghosts:
+            tx, ty = g.home if g.eaten else player_cell
+            # Frightened ghosts maximize the distance instead
+            sign = -1 if g.frightened and not g.eaten else 1
+            rows.append((g.cell[0], g.cell[1], 1 << OPPOSITE[DIR_INDEX[g.dir]], tx, ty, sign))
+            # Distances are integers, so a tiny random jitter only breaks ties
+            chasing = not g.frightened and not g.eaten
+            jitter.append([random.random() * 0.001 for _ in range(4)] if chasing else [0.0] * 4)
+        c, r, opp, tx, ty, sign = np.array(rows).T
+        mask = ADJ_MASK_NP[r, c]
+        # Avoid 180 turn if possible
+        forward = mask & ~opp
+        mask = np.where(forward != 0, forward, mask)
+        valid = (mask[:, None] >> DIR_BITS) & 1 != 0
+        dsq = sign[:, None] * ((c[:, None] + DIR_DX - tx[:, None]) ** 2
+                               + (r[:, None] + DIR_DY - ty[:, None]) ** 2) + np.array(jitter)
+        best = np.where(valid, dsq, np.inf).argmin(axis=1)
+        # Ghosts boxed in on all sides keep their direction
+        for g, d, ok in zip(ghosts, best.tolist(), valid.any(axis=1).tolist()):
+            if ok:
+                g.dir = DIR_VEC[d]
+
+    def handle_collisions(self, player_cell):
+        # Bucket ghosts by cell so only the player's cell needs checking
+        by_cell = {}
         for g in self.ghosts:
-            gc, gr = int(round(g.col)), int(round(g.row))
-            if pc == gc and pr == gr:
-                if g.frightened and not g.eaten:
-                    # eat ghost
-                    self.player.score += 200
-                    g.eaten = True
-                    g.frightened = False
-                elif not g.eaten:
-                    # player hit
-                    self.lose_life_and_reset_positions()
-                    break
+            by_cell.setdefault(g.cell, []).append(g)
+        for g in by_cell.get(player_cell, ()):
+            if g.frightened and not g.eaten:
+                # eat ghost
+                self.player.score += 200
+                g.eaten = True
+                g.frightened = False
+            elif not g.eaten:
+                # player hit
+                self.lose_life_and_reset_positions()
+                break
         # If eaten ghosts reach home, revive
         for g in self.ghosts:
-            if g.eaten and int(round(g.col)) == g.home[0] and int(round(g.row)) == g.home[1]:
+            if g.eaten and g.cell == g.home:
                 g.eaten = False
                 g.frightened = False
 
     def update(self, dt):
-        pressed = pygame.key.get_pressed()
-        self.player.handle_input(pressed)
-        power_trigger = self.player.update(self.maze, dt)
-        if power_trigger == 'power':
-            self.set_power_mode()
+        # Skip the player while it is stalled with no new input. This is an
+        # approximation: a shorter frame could still creep it a fraction of
+        # a cell closer to the wall, so it may stop slightly short
+        if self._input_dirty or not self.player.stalled:
+            self._input_dirty = False
+            power_trigger = self.player.update(self.maze, dt)
+            if power_trigger == 'power':
+                self.set_power_mode()
         # Update ghosts
-        ppos = (int(round(self.player.col)), int(round(self.player.row)))
+        ppos = self.player.cell
+        self.steer_ghosts(ppos)
         for g in self.ghosts:
-            g.update(dt, ppos)
+            g.update(dt)
         # Collisions
-        self.handle_collisions()
+        self.handle_collisions(ppos)
         # Check win/level clear
-        if not self.maze.pellets and not self.maze.power_pellets:
+        if not self.maze.pellets.any() and not self.maze.power_pellets.any():
             # Simple: reset level, keep score/lives
             old_score = self.player.score
             old_lives = self.player.lives
@@ -416,44 +491,90 @@ class Game:
         # Check game over
         if self.player.lives <= 0:
             self.state = STATE_GAMEOVER
-        # Update power timer
-        self.update_power_timer(dt)
+        # Power mode ends at its wall-clock deadline
+        if self.state == STATE_POWER and time.monotonic() >= self._power_deadline:
+            self.state = STATE_PLAYING
+            # Ghosts stop being frightened and eaten ones recover
+            for g in self.ghosts:
+                g.frightened = False
+                g.eaten = False
+
+    def _text(self, slot, text, font=None):
+        # Re-render a HUD slot only when its text changes
+        cached = self._hud_cache.get(slot)
+        if cached is None or cached[0] != text:
+            cached = self._hud_cache[slot] = (text, (font or self.font).render(text, True, WHITE))
+        return cached[1]
 
     def draw_hud(self, surf):
         hud_rect = pygame.Rect(0, ROWS * TILE_SIZE, WIDTH, 60)
         pygame.draw.rect(surf, BLACK, hud_rect)
         pygame.draw.line(surf, GRAY, (0, ROWS * TILE_SIZE), (WIDTH, ROWS * TILE_SIZE), 2)
-        score_s = self.font.render(f"Score: {self.player.score}", True, WHITE)
-        lives_s = self.font.render(f"Lives: {self.player.lives}", True, WHITE)
-        state_s = self.font.render(f"Mode: {self.state}", True, WHITE)
+        score_s = self._text('score', f"Score: {self.player.score}")
+        lives_s = self._text('lives', f"Lives: {self.player.lives}")
+        state_s = self._text('state', f"Mode: {self.state}")
         surf.blit(score_s, (10, ROWS * TILE_SIZE + 10))
         surf.blit(lives_s, (170, ROWS * TILE_SIZE + 10))
         surf.blit(state_s, (310, ROWS * TILE_SIZE + 10))
         if self.state == STATE_POWER:
-            tleft = max(0, self.power_timer)
-            timer_s = self.font.render(f"Power: {tleft:0.1f}s", True, WHITE)
+            tleft = self.power_time_left()
+            timer_s = self._text('power', f"Power: {tleft:0.1f}s")
             surf.blit(timer_s, (480, ROWS * TILE_SIZE + 10))
         if self.state == STATE_GAMEOVER:
-            over = self.big_font.render("GAME OVER - Press R to Restart", True, WHITE)
+            over = self._text('over', "GAME OVER - Press R to Restart", self.big_font)
             rect = over.get_rect(center=(WIDTH//2, ROWS * TILE_SIZE + 35))
             surf.blit(over, rect)
 
     def draw(self):
-        self.screen.fill(BLACK)
-        self.maze.draw(self.screen)
-        for g in self.ghosts:
-            g.draw(self.screen)
-        self.player.draw(self.screen)
-        self.draw_hud(self.screen)
-        pygame.display.flip()
+        rects = [cell_rect(self.player.col, self.player.row)]
+        rects += [cell_rect(g.col, g.row) for g in self.ghosts]
+        looks = [g.frightened and not g.eaten for g in self.ghosts]
+        power = f"{self.power_time_left():0.1f}" if self.state == STATE_POWER else None
+        hud_key = (self.player.score, self.player.lives, self.state, power)
+        if self._prev_rects is None:
+            # Full redraw; the wall surface already has a black background
+            self.maze.draw(self.screen)
+            for g in self.ghosts:
+                g.draw(self.screen)
+            self.player.draw(self.screen)
+            self.draw_hud(self.screen)
+            pygame.display.flip()
+        else:
+            if (rects == self._prev_rects and looks == self._prev_looks
+                    and hud_key == self._hud_key and not self.maze.cleared):
+                return
+            # Restore the background under last frame's sprites and any
+            # eaten pellets, then redraw the sprites at their new cells
+            dirty = self._prev_rects + rects
+            dirty += [cell_rect(c, r) for c, r in self.maze.cleared]
+            self.maze.cleared.clear()
+            for rect in dirty:
+                self.maze.draw_area(self.screen, rect)
+            for g in self.ghosts:
+                g.draw(self.screen)
+            self.player.draw(self.screen)
+            if hud_key != self._hud_key:
+                self.draw_hud(self.screen)
+                dirty.append(pygame.Rect(0, ROWS * TILE_SIZE, WIDTH, HEIGHT - ROWS * TILE_SIZE))
+            pygame.display.update(dirty)
+        self._prev_rects = rects
+        self._prev_looks = looks
+        self._hud_key = hud_key
 
     def process_events(self):
         for event in pygame.event.get():
             if event.type == QUIT:
                 return False
+            if event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                # Window contents may be lost; repaint everything next frame
+                self._prev_rects = None
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     return False
+                d = KEY_DIRS.get(event.key)
+                if d is not None:
+                    self.player.next_dir = d
+                    self._input_dirty = True
                 if self.state == STATE_GAMEOVER and event.unicode.lower() == 'r':
                     # restart
                     old_score = 0